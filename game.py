@@ -1,4 +1,6 @@
 import pygame
+import heapq
+import logging
 import random
 import math
 import os
@@ -6,17 +8,62 @@ from typing import Dict, List, Tuple, Optional, Union
 from rpg_modules.items import ItemGenerator, Item, Weapon, Armor, Hands, Consumable
 from rpg_modules.ui import InventoryUI, EquipmentUI, ItemGeneratorUI
 from rpg_modules.entities import Player
+from rpg_modules.core import SpatialHash
 from rpg_modules.core.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, FPS,
     WHITE, BLACK, RED, GREEN, BLUE, GRAY,
     QUALITY_COLORS
 )
 
+logger = logging.getLogger(__name__)
+
 # Player stats
 PLAYER_HP = 100
 PLAYER_ATTACK = 10
 PLAYER_DEFENSE = 5
 
+# Frame rate while the window does not have focus
+BACKGROUND_FPS = 10
+
+# Longest time to block waiting for input while no UI panel is open (ms)
+IDLE_WAIT_MS = 250
+
+# Time without input after which open panels stop polling every frame (ms);
+# well past the point where their hover tooltips have appeared
+IDLE_AFTER_MS = 2000
+
+# Movement direction for each arrow key
+MOVE_KEYS = {
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1)
+}
+
+# UI mode opened by each hotkey (None closes whatever is open)
+MODE_KEYS = {
+    pygame.K_i: "equip",
+    pygame.K_g: "generate",
+    pygame.K_ESCAPE: None
+}
+
+# Event types nothing in the game reacts to; blocked so SDL drops them
+# before they reach the event queue
+UNUSED_EVENTS = [
+    pygame.ACTIVEEVENT, pygame.VIDEOEXPOSE,
+    pygame.KEYUP, pygame.TEXTINPUT, pygame.TEXTEDITING,
+    pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL
+]
+
+# Equipment slot for item classes that always go in the same slot
+ITEM_SLOTS = {
+    Weapon: 'weapon',
+    Hands: 'hands'
+}
+
+# Equipment slots that contribute armor defense
+ARMOR_SLOTS = ('head', 'chest', 'legs', 'feet')
+
 # Monster stats
 MONSTER_HP = 50
 MONSTER_ATTACK = 5
@@ -29,48 +76,6 @@ WALL_IMAGE = "wall.png"
 PLAYER_IMAGE = "player.png"
 MONSTER_IMAGE = "monster.png"
 
-def load_assets():
-    """Load all game assets"""
-    assets = {}
-    
-    # Create placeholder assets if they don't exist
-    if not os.path.exists(ASSET_PATH):
-        os.makedirs(ASSET_PATH)
-    
-    # Load or create floor image
-    floor_path = os.path.join(ASSET_PATH, FLOOR_IMAGE)
-    if not os.path.exists(floor_path):
-        floor_surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
-        floor_surface.fill((200, 200, 200))
-        pygame.image.save(floor_surface, floor_path)
-    assets['floor'] = pygame.image.load(floor_path)
-    
-    # Load or create wall image
-    wall_path = os.path.join(ASSET_PATH, WALL_IMAGE)
-    if not os.path.exists(wall_path):
-        wall_surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
-        wall_surface.fill((100, 100, 100))
-        pygame.image.save(wall_surface, wall_path)
-    assets['wall'] = pygame.image.load(wall_path)
-    
-    # Load or create player image
-    player_path = os.path.join(ASSET_PATH, PLAYER_IMAGE)
-    if not os.path.exists(player_path):
-        player_surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
-        player_surface.fill(BLUE)
-        pygame.image.save(player_surface, player_path)
-    assets['player'] = pygame.image.load(player_path)
-    
-    # Load or create monster image
-    monster_path = os.path.join(ASSET_PATH, MONSTER_IMAGE)
-    if not os.path.exists(monster_path):
-        monster_surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
-        monster_surface.fill(RED)
-        pygame.image.save(monster_surface, monster_path)
-    assets['monster'] = pygame.image.load(monster_path)
-    
-    return assets
-
 # Game states
 class GameState:
     def __init__(self):
@@ -84,20 +89,21 @@ class GameState:
     def load_assets(self):
         """Load game assets"""
         try:
-            # Load images
-            self.assets['floor'] = pygame.Surface((TILE_SIZE, TILE_SIZE))
+            # Load images, in the display's pixel format so blitting them
+            # needs no per-pixel conversion
+            self.assets['floor'] = pygame.Surface((TILE_SIZE, TILE_SIZE)).convert()
             self.assets['floor'].fill(GRAY)
             
-            self.assets['wall'] = pygame.Surface((TILE_SIZE, TILE_SIZE))
+            self.assets['wall'] = pygame.Surface((TILE_SIZE, TILE_SIZE)).convert()
             self.assets['wall'].fill(BLACK)
             
             # Load sounds
             pygame.mixer.init()
             self.assets['silent_sound'] = pygame.mixer.Sound(buffer=bytearray(0))
             
-            print("Assets loaded successfully")
+            logger.debug("Assets loaded successfully")
         except Exception as e:
-            print(f"Error loading assets: {e}")
+            logger.error("Error loading assets: %s", e)
 
 class Camera:
     def __init__(self, width: int, height: int):
@@ -106,26 +112,32 @@ class Camera:
         self.height = height
         self.x = 0
         self.y = 0
+        
+        # Scroll limits depend only on the size, so work them out once
+        self.min_x = -(width - SCREEN_WIDTH)
+        self.min_y = -(height - SCREEN_HEIGHT)
 
     def apply(self, entity):
         return entity.rect.move(self.camera.topleft)
 
     def update(self, target):
-        x = -target.rect.x + int(SCREEN_WIDTH / 2)
-        y = -target.rect.y + int(SCREEN_HEIGHT / 2)
+        x = -target.rect.x + SCREEN_WIDTH // 2
+        y = -target.rect.y + SCREEN_HEIGHT // 2
         
         # Limit scrolling to map size
         x = min(0, x)  # Left
         y = min(0, y)  # Top
-        x = max(-(self.width - SCREEN_WIDTH), x)  # Right
-        y = max(-(self.height - SCREEN_HEIGHT), y)  # Bottom
+        x = max(self.min_x, x)  # Right
+        y = max(self.min_y, y)  # Bottom
         
-        self.camera = pygame.Rect(x, y, self.width, self.height)
+        self.camera.topleft = (x, y)
         self.x = x
         self.y = y
 
 class Equipment:
     """Class to manage equipped items."""
+    __slots__ = ('slots',)
+    
     def __init__(self):
         self.slots = {
             'head': None,
@@ -145,13 +157,13 @@ class Equipment:
         Equip an item in its appropriate slot.
         Returns True if successful, False if no appropriate slot.
         """
-        slot = None
-        if isinstance(item, Weapon):
-            slot = 'weapon'
-        elif isinstance(item, Hands):
-            slot = 'hands'
-        elif isinstance(item, Armor):
-            slot = item.armor_type.lower()
+        slot = ITEM_SLOTS.get(type(item))
+        if slot is None:
+            if isinstance(item, Armor):
+                slot = item.armor_type.lower()
+            else:
+                # Subclasses fall back to the slot of a registered base class
+                slot = next((s for cls, s in ITEM_SLOTS.items() if isinstance(item, cls)), None)
             
         if slot and slot in self.slots:
             self.slots[slot] = item
@@ -168,24 +180,34 @@ class Equipment:
 
 class Inventory:
     """Class to manage the player's inventory."""
+    __slots__ = ('items', '_free_slots', '_item_slots')
+    
     def __init__(self, capacity: int = 40):  # Changed from 32 to 40 to match 5x8 grid
         self.items = [None] * capacity
+        # Empty slot indices as a min-heap, so the first empty slot is on top
+        self._free_slots = list(range(capacity))
+        # Slot index of each stored item, keyed by id(item)
+        self._item_slots: Dict[int, int] = {}
         
     def add_item(self, item: Item) -> bool:
         """Add an item to the first empty slot. Returns True if successful."""
-        for i in range(len(self.items)):
-            if self.items[i] is None:
-                self.items[i] = item
+        free_slots = self._free_slots
+        while free_slots:
+            index = heapq.heappop(free_slots)
+            if self.items[index] is None:
+                self.items[index] = item
+                self._item_slots[id(item)] = index
                 return True
         return False
         
     def remove_item(self, item: Item) -> bool:
-        """Remove the first occurrence of an item. Returns True if successful."""
-        for i in range(len(self.items)):
-            if self.items[i] is item:
-                self.items[i] = None
-                return True
-        return False
+        """Remove an item from its slot. Returns True if successful."""
+        index = self._item_slots.pop(id(item), None)
+        if index is None or self.items[index] is not item:
+            return False
+        self.items[index] = None
+        heapq.heappush(self._free_slots, index)
+        return True
         
     def get_item_at(self, index: int) -> Optional[Item]:
         """Get the item at the given index."""
@@ -218,7 +240,7 @@ class Player(pygame.sprite.Sprite):
 
     def attack(self):
         """Perform an attack"""
-        print(f"Player attacks with power {self.attack_power}")
+        logger.debug("Player attacks with power %d", self.attack_power)
 
     def recalculate_stats(self):
         """Recalculate player stats based on equipped items"""
@@ -231,7 +253,7 @@ class Player(pygame.sprite.Sprite):
             base_attack += weapon.attack_power
             
         # Add armor defense
-        for slot in ['head', 'chest', 'legs', 'feet']:
+        for slot in ARMOR_SLOTS:
             armor = self.equipment.get_equipped_item(slot)
             if armor:
                 base_defense += armor.defense
@@ -251,12 +273,13 @@ class Player(pygame.sprite.Sprite):
             self.recalculate_stats()
         return item
 
-    def move(self, dx: int, dy: int, walls: pygame.sprite.Group):
+    def move(self, dx: int, dy: int, walls: SpatialHash):
+        old_rect = self.rect.copy()
         self.rect.x += dx * self.speed
         self.rect.y += dy * self.speed
         
-        # Check for collisions with walls
-        for wall in walls:
+        # Check for collisions with walls near the swept area
+        for wall in walls.query_rect(self.rect.union(old_rect)):
             if self.rect.colliderect(wall.rect):
                 if dx > 0:  # Moving right
                     self.rect.right = wall.rect.left
@@ -271,39 +294,79 @@ class Player(pygame.sprite.Sprite):
         """Draw the player on the screen"""
         screen.blit(self.image, camera.apply(self))
 
-class Wall(pygame.sprite.Sprite):
+class Wall:
+    """A solid map tile. Walls are only used for collision, so each one
+    stores just its rect."""
+    __slots__ = ('rect',)
+    
     def __init__(self, x: int, y: int):
-        super().__init__()
-        self.image = pygame.Surface((TILE_SIZE, TILE_SIZE))
-        self.image.fill(BLACK)
-        self.rect = self.image.get_rect()
-        self.rect.x = x * TILE_SIZE
-        self.rect.y = y * TILE_SIZE
+        self.rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
 
-def create_map(width: int, height: int) -> Tuple[pygame.sprite.Group, List[List[int]]]:
+def create_map(width: int, height: int) -> Tuple[List[Wall], List[bytearray]]:
     """Create a simple map with walls around the edges"""
-    walls = pygame.sprite.Group()
-    map_grid = [[0 for _ in range(width)] for _ in range(height)]
+    walls = []
+    
+    # One compact byte row per map row (1 = wall, 0 = floor), with the top
+    # and bottom rows and the two side columns set in bulk
+    map_grid = [bytearray(width) for _ in range(height)]
+    map_grid[0][:] = map_grid[height - 1][:] = b'\x01' * width
+    for row in map_grid:
+        row[0] = row[width - 1] = 1
     
-    # Create walls around the edges
+    # Create walls around the edges (the side columns skip the corners,
+    # which the top and bottom rows already cover)
     for x in range(width):
-        walls.add(Wall(x, 0))
-        walls.add(Wall(x, height - 1))
-        map_grid[0][x] = 1
-        map_grid[height - 1][x] = 1
+        walls.append(Wall(x, 0))
+        walls.append(Wall(x, height - 1))
     
-    for y in range(height):
-        walls.add(Wall(0, y))
-        walls.add(Wall(width - 1, y))
-        map_grid[y][0] = 1
-        map_grid[y][width - 1] = 1
+    for y in range(1, height - 1):
+        walls.append(Wall(0, y))
+        walls.append(Wall(width - 1, y))
     
     return walls, map_grid
 
+def render_map(map_grid: List[bytearray], wall_image: pygame.Surface,
+               floor_image: pygame.Surface) -> pygame.Surface:
+    """
+    Render every tile of a map into a single surface.
+
+    Args:
+        map_grid: Map rows as returned by create_map (1 = wall, anything else = floor)
+        wall_image: Tile image for walls
+        floor_image: Tile image for floors
+
+    Returns:
+        A surface covering the whole map, with tile (0, 0) at its top-left
+    """
+    height = len(map_grid)
+    width = len(map_grid[0]) if height else 0
+    surface = pygame.Surface((width * TILE_SIZE, height * TILE_SIZE)).convert()
+    surface.blits(
+        [
+            (wall_image if row[x] == 1 else floor_image, (x * TILE_SIZE, y * TILE_SIZE))
+            for y, row in enumerate(map_grid)
+            for x in range(width)
+        ],
+        doreturn=False
+    )
+    return surface
+
 def main():
-    pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # Only bring up the subsystems the game uses (the mixer is started by
+    # GameState.load_assets); pygame.init() would also probe joysticks and
+    # every other SDL subsystem on startup.
+    pygame.display.init()
+    pygame.font.init()
+    # Present through SDL's GPU renderer with vsync where possible, and fall
+    # back to a plain software window where no renderer supports it
+    try:
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED, vsync=1)
+    except pygame.error:
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("RPG Game")
+    pygame.event.set_blocked(UNUSED_EVENTS)
+    # No panel is open at startup, so nothing needs mouse motion yet
+    pygame.event.set_blocked(pygame.MOUSEMOTION)
     clock = pygame.time.Clock()
     
     # Initialize game state and load assets
@@ -315,6 +378,14 @@ def main():
     map_height = 50
     walls, map_grid = create_map(map_width, map_height)
     
+    # Index walls by tile so movement only tests nearby ones
+    wall_hash = SpatialHash(TILE_SIZE)
+    for wall in walls:
+        wall_hash.insert(wall)
+    
+    # The map never changes, so render all of its tiles once up front
+    map_surface = render_map(map_grid, game_state.assets['wall'], game_state.assets['floor'])
+    
     # Create game objects
     player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
     camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
@@ -333,93 +404,104 @@ def main():
     equipment_ui = EquipmentUI(start_x + inventory_width + spacing, 50)  # Right side
     item_generator = ItemGeneratorUI(start_x + inventory_width + spacing, 50)  # Right side, same position as equipment
     
+    # Panels in event/update order; each one's visibility follows the mode
+    panels = (inventory_ui, equipment_ui, item_generator)
+    
     # Initialize mode
     current_mode = None  # None, "equip", or "generate"
     
+    # Bind the per-frame calls once instead of looking them up every frame
+    get_events = pygame.event.get
+    wait_event = pygame.event.wait
+    flip = pygame.display.flip
+    tick = clock.tick
+    get_ticks = pygame.time.get_ticks
+    
     # Main game loop
+    focused = True
+    last_input_ms = 0
+    drawn = False
     running = True
     while running:
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        # Handle events. With every panel closed, or once the open panels'
+        # hover timers have settled after a spell without input, nothing
+        # changes on screen until the next event, so sleep until one arrives
+        # (or a timeout passes) instead of polling at the full frame rate.
+        polling = current_mode and get_ticks() - last_input_ms < IDLE_AFTER_MS
+        if polling:
+            events = get_events()
+        else:
+            event = wait_event(IDLE_WAIT_MS)
+            events = [event] + get_events() if event.type != pygame.NOEVENT else []
+        if events:
+            last_input_ms = get_ticks()
+        exposed = False
+        for event in events:
+            etype = event.type
+            if etype == pygame.QUIT:
                 running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_i:
-                    if current_mode == "equip":
-                        current_mode = None
-                        inventory_ui.visible = False
-                        equipment_ui.visible = False
-                    else:
-                        current_mode = "equip"
-                        inventory_ui.visible = True
-                        equipment_ui.visible = True
-                        item_generator.visible = False
-                elif event.key == pygame.K_g:
-                    if current_mode == "generate":
-                        current_mode = None
-                        inventory_ui.visible = False
-                        item_generator.visible = False
-                    else:
-                        current_mode = "generate"
-                        inventory_ui.visible = True
-                        item_generator.visible = True
-                        equipment_ui.visible = False
-                elif event.key == pygame.K_ESCAPE:
-                    current_mode = None
-                    inventory_ui.visible = False
-                    equipment_ui.visible = False
-                    item_generator.visible = False
-            
-            # Handle UI events only if in a mode
+            elif etype == pygame.WINDOWFOCUSLOST:
+                focused = False
+            elif etype == pygame.WINDOWFOCUSGAINED:
+                focused = True
+            elif etype == pygame.WINDOWEXPOSED:
+                exposed = True
+            elif etype == pygame.KEYDOWN and event.key in MODE_KEYS:
+                # A mode's key toggles it; Escape maps to None and always closes
+                mode = MODE_KEYS[event.key]
+                current_mode = None if current_mode == mode else mode
+                inventory_ui.visible = current_mode is not None
+                equipment_ui.visible = current_mode == "equip"
+                item_generator.visible = current_mode == "generate"
+                # Only the open panels track the mouse, so let SDL drop
+                # motion events while none is showing
+                if current_mode:
+                    pygame.event.set_allowed(pygame.MOUSEMOTION)
+                else:
+                    pygame.event.set_blocked(pygame.MOUSEMOTION)
+
+            # Hand the event to the panels open when it arrived (inventory first)
             if current_mode:
-                # Always handle inventory events first
-                inventory_handled = inventory_ui.handle_event(event, player)
-                
-                if current_mode == "equip":
-                    equipment_handled = equipment_ui.handle_event(event, player)
-                    if inventory_handled or equipment_handled:
-                        continue
-                elif current_mode == "generate":
-                    if inventory_handled or item_generator.handle_event(event, player):
-                        continue
-            
+                for panel in panels:
+                    if panel.visible:
+                        panel.handle_event(event, player)
             # Handle player movement only if not in any mode
-            if not current_mode:
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_LEFT:
-                        player.move(-1, 0, walls)
-                    elif event.key == pygame.K_RIGHT:
-                        player.move(1, 0, walls)
-                    elif event.key == pygame.K_UP:
-                        player.move(0, -1, walls)
-                    elif event.key == pygame.K_DOWN:
-                        player.move(0, 1, walls)
-                    elif event.key == pygame.K_SPACE:
-                        player.attack()
+            elif etype == pygame.KEYDOWN:
+                direction = MOVE_KEYS.get(event.key)
+                if direction:
+                    player.move(direction[0], direction[1], wall_hash)
+                elif event.key == pygame.K_SPACE:
+                    player.attack()
+
+        # In the background, keep handling events but skip updating and
+        # drawing, and wake up far less often. A window that is uncovered
+        # while unfocused still needs repainting, so let that frame through.
+        if not focused and not exposed:
+            tick(BACKGROUND_FPS)
+            continue
+        
+        # An idle wait that timed out changed nothing, so the last frame is
+        # still on screen; skip updating and redrawing it
+        if not polling and not events and drawn:
+            tick(FPS)
+            continue
+        drawn = True
         
         # Update game state
         player.update()
         camera.update(player)
         
-        # Update UI elements based on current mode
-        if current_mode:
-            # Always update inventory UI first
-            inventory_ui.update()
-            if current_mode == "equip":
-                equipment_ui.update()
-            elif current_mode == "generate":
-                item_generator.update()
+        # Update the open panels
+        for panel in panels:
+            if panel.visible:
+                panel.update()
         
         # Draw everything
         screen.fill(BLACK)
         
-        # Draw map
-        for y, row in enumerate(map_grid):
-            for x, cell in enumerate(row):
-                if cell == 1:  # Wall
-                    screen.blit(game_state.assets['wall'], (x * TILE_SIZE - camera.x, y * TILE_SIZE - camera.y))
-                else:  # Floor
-                    screen.blit(game_state.assets['floor'], (x * TILE_SIZE - camera.x, y * TILE_SIZE - camera.y))
+        # Draw the map from its pre-rendered image; SDL clips the blit to
+        # the screen, so only the visible part is copied
+        screen.blit(map_surface, (-camera.x, -camera.y))
         
         # Draw player
         player.draw(screen, camera)
@@ -446,10 +528,19 @@ def main():
             if inventory_ui.visible and tooltip_visible:
                 inventory_ui.draw_tooltip(screen)
             
-        pygame.display.flip()
-        clock.tick(60)
+        flip()
+        tick(FPS)
     
     pygame.quit()
 
 if __name__ == "__main__":
+    # Diagnostics stay quiet unless asked for, e.g. RPG_LOG=debug; an
+    # unknown level falls back to WARNING instead of stopping the game
+    log_level = (os.environ.get("RPG_LOG") or "WARNING").upper()
+    level = logging.getLevelName(log_level)
+    if isinstance(level, int):
+        logging.basicConfig(level=level)
+    else:
+        logging.basicConfig(level=logging.WARNING)
+        logger.warning("Unknown RPG_LOG level %r, using WARNING", log_level)
     main() 
\ No newline at end of file
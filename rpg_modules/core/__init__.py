@@ -3,10 +3,12 @@ Core functionality and constants for RPG games.
 """
 
 from .constants import *
+from .spatial_hash import SpatialHash
 
 __all__ = [
     'SCREEN_WIDTH', 'SCREEN_HEIGHT', 'TILE_SIZE', 'FPS',
     'WHITE', 'BLACK', 'RED', 'GREEN', 'BLUE', 'GRAY', 'SILVER', 'PURPLE', 'GOLD',
     'WEAPON_TYPES', 'ARMOR_TYPES', 'MATERIALS', 'QUALITIES',
-    'PREFIXES', 'UI_COLORS', 'QUALITY_COLORS', 'FONT_SIZES', 'UI_DIMENSIONS'
+    'PREFIXES', 'UI_COLORS', 'QUALITY_COLORS', 'FONT_SIZES', 'UI_DIMENSIONS',
+    'SpatialHash'
 ] 
\ No newline at end of file
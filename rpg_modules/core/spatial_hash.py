@@ -0,0 +1,63 @@
+"""
+Spatial hash for broad-phase proximity queries.
+"""
+
+import pygame
+from typing import Any, Dict, Iterator, List, Tuple
+
+class SpatialHash:
+    """Uniform grid that buckets objects with a ``rect`` by the cells they cover."""
+
+    def __init__(self, cell_size: int = 128):
+        """
+        Initialize an empty spatial hash.
+
+        Args:
+            cell_size: Width and height of a grid cell in pixels
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Any]] = {}
+
+    def _cells_for(self, rect: pygame.Rect) -> Iterator[Tuple[int, int]]:
+        """Yield the keys of every cell the given rect overlaps."""
+        size = self.cell_size
+        left = rect.left // size
+        top = rect.top // size
+        right = (rect.right - 1) // size
+        bottom = (rect.bottom - 1) // size
+        for cy in range(top, bottom + 1):
+            for cx in range(left, right + 1):
+                yield (cx, cy)
+
+    def insert(self, obj: Any) -> None:
+        """Add an object to every cell its rect overlaps."""
+        for key in self._cells_for(obj.rect):
+            self.cells.setdefault(key, []).append(obj)
+
+    def remove(self, obj: Any) -> None:
+        """Remove an object from the cells its rect overlaps."""
+        for key in self._cells_for(obj.rect):
+            bucket = self.cells.get(key)
+            if bucket and obj in bucket:
+                bucket.remove(obj)
+                if not bucket:
+                    del self.cells[key]
+
+    def query_rect(self, rect: pygame.Rect) -> List[Any]:
+        """
+        Get the objects stored in the cells the given rect overlaps.
+
+        Args:
+            rect: Area to search
+
+        Returns:
+            Candidate objects, each listed once, in insertion order per cell
+        """
+        found = {}
+        for key in self._cells_for(rect):
+            bucket = self.cells.get(key)
+            if bucket:
+                for obj in bucket:
+                    found[id(obj)] = obj
+        return list(found.values())
+
@@ -6,6 +6,18 @@ import pygame
 from typing import Optional, Dict, Any
 from ..core.constants import TILE_SIZE, GRAY, QUALITY_COLORS
 
+# Placeholder sprite shared by every item that has no art of its own.
+# Built on first use so importing the module does not touch pygame.
+_DEFAULT_SPRITE: Optional[pygame.Surface] = None
+
+def _get_default_sprite() -> pygame.Surface:
+    """Get the shared default item sprite, creating it if needed."""
+    global _DEFAULT_SPRITE
+    if _DEFAULT_SPRITE is None:
+        _DEFAULT_SPRITE = pygame.Surface((32, 32))
+        _DEFAULT_SPRITE.fill((200, 200, 200))  # Default gray color
+    return _DEFAULT_SPRITE
+
 class Item:
     """Base class for all items in the game."""
     
@@ -27,9 +39,8 @@ class Item:
         self.material = material
         self.prefix = prefix
         
-        # Load default item sprite
-        self.sprite = pygame.Surface((32, 32))
-        self.sprite.fill((200, 200, 200))  # Default gray color
+        # Share the default item sprite instead of allocating one per item
+        self.sprite = _get_default_sprite()
         
     @property
     def display_name(self) -> str:
@@ -13,20 +13,40 @@ from .armor import Armor
 from .hands import Hands
 from .consumable import Consumable
 
+# Item categories picked from when no type is requested
+ITEM_CATEGORIES = ('weapon', 'armor', 'consumable')
+CONSUMABLE_TYPES = ('health', 'mana', 'stamina')
+
+# Prefix pool for each quality level
+PREFIX_POOLS = {
+    'Legendary': PREFIXES['rare'],
+    'Masterwork': PREFIXES['uncommon'] + PREFIXES['rare'],
+    'Polished': PREFIXES['uncommon'],
+    'Standard': PREFIXES['common']
+}
+
+# Quality multiplier affects item stats
+QUALITY_MULTIPLIERS = {
+    'Standard': 1.0,
+    'Polished': 1.2,
+    'Masterwork': 1.5,
+    'Legendary': 2.0
+}
+
+# Chance of rolling a prefix for each quality level
+PREFIX_CHANCES = {
+    'Standard': 0.1,
+    'Polished': 0.2,
+    'Masterwork': 0.4,
+    'Legendary': 0.8
+}
+
 class ItemGenerator:
     """Generator for creating items with various properties."""
     
     def _get_prefix_for_quality(self, quality: str) -> Optional[str]:
         """Get a random prefix appropriate for the item's quality."""
-        if quality == 'Legendary':
-            prefix_pool = PREFIXES['rare']
-        elif quality == 'Masterwork':
-            prefix_pool = PREFIXES['uncommon'] + PREFIXES['rare']
-        elif quality == 'Polished':
-            prefix_pool = PREFIXES['uncommon']
-        else:  # Standard
-            prefix_pool = PREFIXES['common']
-            
+        prefix_pool = PREFIX_POOLS.get(quality, PREFIXES['common'])
         return random.choice(prefix_pool) if prefix_pool else None
     
     def generate_item(
@@ -46,27 +66,17 @@ class ItemGenerator:
         """
         # Determine item type if not specified
         if not item_type:
-            item_type = random.choice(['weapon', 'armor', 'consumable'])
+            item_type = random.choice(ITEM_CATEGORIES)
             
         # Determine quality if not specified
         if not quality:
             quality = random.choice(QUALITIES)
             
         # Quality multiplier affects item stats
-        quality_multiplier = {
-            'Standard': 1.0,
-            'Polished': 1.2,
-            'Masterwork': 1.5,
-            'Legendary': 2.0
-        }.get(quality, 1.0)
+        quality_multiplier = QUALITY_MULTIPLIERS.get(quality, 1.0)
         
         # Random chance for prefix based on quality
-        prefix_chance = {
-            'Standard': 0.1,
-            'Polished': 0.2,
-            'Masterwork': 0.4,
-            'Legendary': 0.8
-        }.get(quality, 0.1)
+        prefix_chance = PREFIX_CHANCES.get(quality, 0.1)
         
         prefix = self._get_prefix_for_quality(quality) if random.random() < prefix_chance else None
         material = random.choice(MATERIALS)
@@ -111,8 +121,7 @@ class ItemGenerator:
                 )
                 
         else:  # Consumable
-            effect_types = ['health', 'mana', 'stamina']
-            consumable_type = random.choice(effect_types)
+            consumable_type = random.choice(CONSUMABLE_TYPES)
             base_value = random.randint(20, 50)
             effect_value = int(base_value * quality_multiplier)
             
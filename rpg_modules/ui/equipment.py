@@ -9,6 +9,7 @@ from ..core.constants import (
     FONT_SIZES
 )
 from ..items import Item, Weapon, Armor, Hands, Consumable
+from .render_cache import get_font, get_scaled_sprite, render_text
 
 class EquipmentUI:
     """A reusable equipment UI component for pygame games."""
@@ -27,8 +28,8 @@ class EquipmentUI:
         self.visible = False
         
         # Initialize fonts
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 18)
+        self.font = get_font(24)
+        self.small_font = get_font(18)
         
         # Initialize tooltip
         self.hovered_slot = None
@@ -60,6 +61,14 @@ class EquipmentUI:
             'feet': ('above', 5)
         }
         
+        # Slot names never change, so render and place their labels once
+        self.slot_labels = []
+        for slot_name, slot_rect in self.slots.items():
+            label = self.small_font.render(slot_name.capitalize(), True, (255, 255, 255))
+            label_x = slot_rect.centerx - label.get_width() // 2
+            label_y = slot_rect.y - label.get_height() - 5
+            self.slot_labels.append((label, (label_x, label_y)))
+        
     def get_slot_at_pos(self, mouse_pos: Tuple[int, int]) -> Optional[str]:
         """Get the equipment slot at the given mouse position."""
         if not self.rect.collidepoint(mouse_pos):
@@ -78,9 +87,10 @@ class EquipmentUI:
         if event.type == pygame.MOUSEBUTTONDOWN:
             slot_name = self.get_slot_at_pos(event.pos)
             if slot_name:
-                item = player.unequip_item(slot_name)
-                if item:
-                    player.inventory.add_item(item)
+                # Only take the item off once the inventory has room for it
+                item = player.equipment.get_equipped_item(slot_name)
+                if item and player.inventory.add_item(item):
+                    player.unequip_item(slot_name)
                 return True
                 
         elif event.type == pygame.MOUSEMOTION:
@@ -110,26 +120,23 @@ class EquipmentUI:
         pygame.draw.rect(screen, (255, 255, 255), self.rect, 2)
         
         # Draw header
-        header_text = self.font.render("Equipment", True, (255, 255, 255))
+        header_text = render_text(self.font, "Equipment", (255, 255, 255))
         screen.blit(header_text, (self.rect.x + 10, self.rect.y + 10))
         
+        # Draw slot names (labels sit above their slots, so they never overlap them)
+        screen.blits(self.slot_labels, doreturn=False)
+        
         # Draw slots
         for slot_name, slot_rect in self.slots.items():
             # Draw slot background
             pygame.draw.rect(screen, (30, 30, 30), slot_rect)
             
-            # Draw slot name
-            name_text = self.small_font.render(slot_name.capitalize(), True, (255, 255, 255))
-            text_x = slot_rect.centerx - name_text.get_width() // 2
-            text_y = slot_rect.y - name_text.get_height() - 5
-            screen.blit(name_text, (text_x, text_y))
-            
             # Draw equipped item if any
             item = player.equipment.get_equipped_item(slot_name)
             if item:
                 # Draw item sprite
                 sprite = item.get_equipment_sprite()
-                scaled_sprite = pygame.transform.scale(sprite, (slot_rect.width - 20, slot_rect.height - 20))
+                scaled_sprite = get_scaled_sprite(sprite, (slot_rect.width - 20, slot_rect.height - 20))
                 screen.blit(scaled_sprite, (slot_rect.x + 10, slot_rect.y + 10))
                 
                 # Draw quality-colored border
@@ -183,20 +190,20 @@ class EquipmentUI:
         
         # Draw item sprite with border
         sprite = item.get_equipment_sprite()
-        scaled_sprite = pygame.transform.scale(sprite, (128, 128))
+        scaled_sprite = get_scaled_sprite(sprite, (128, 128))
         sprite_rect = pygame.Rect(tooltip_rect.x + 10, tooltip_rect.y + 10, 134, 134)
         pygame.draw.rect(screen, border_color, sprite_rect, 3)
         screen.blit(scaled_sprite, (tooltip_rect.x + 13, tooltip_rect.y + 13))
         
         # Draw item name
-        name_text = self.font.render(item.display_name, True, (255, 255, 255))
+        name_text = render_text(self.font, item.display_name, (255, 255, 255))
         screen.blit(name_text, (tooltip_rect.x + 10, tooltip_rect.y + 150))
         
         # Draw item stats
         y_offset = 180
         stats = self._get_item_stats(item)
         for stat in stats:
-            stat_text = self.small_font.render(stat, True, (255, 255, 255))
+            stat_text = render_text(self.small_font, stat, (255, 255, 255))
             screen.blit(stat_text, (tooltip_rect.x + 10, tooltip_rect.y + y_offset))
             y_offset += 20
             
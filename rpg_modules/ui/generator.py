@@ -3,7 +3,6 @@ Item Generator UI component for RPG games.
 """
 
 import pygame
-import random
 from typing import Optional, Dict, Tuple, List
 from ..core.constants import (
     UI_COLORS, UI_DIMENSIONS, QUALITY_COLORS,
@@ -11,6 +10,7 @@ from ..core.constants import (
 )
 from ..items import Item, Weapon, Armor, Hands, Consumable
 from ..items.generator import ItemGenerator
+from .render_cache import get_font, get_scaled_sprite, render_text
 
 class ItemGeneratorUI:
     """A reusable item generator UI component for pygame games."""
@@ -29,8 +29,8 @@ class ItemGeneratorUI:
         self.visible = False
         
         # Initialize fonts
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 18)
+        self.font = get_font(24)
+        self.small_font = get_font(18)
         
         # Create type dropdown
         self.type_dropdown = pygame.Rect(x + 10, y + 50, width - 20, 40)
@@ -103,18 +103,12 @@ class ItemGeneratorUI:
             
             # Handle generate button
             if self.generate_button.collidepoint(mouse_pos):
-                # Determine type if random
-                item_type = self.selected_type
-                if item_type == 'Random':
-                    item_type = random.choice(['Weapon', 'Armor', 'Consumable'])
-                
-                # Determine quality if random
-                quality = self.selected_quality
-                if quality == 'Random':
-                    quality = random.choice(QUALITIES)
+                # 'Random' selections are left to the item generator
+                item_type = None if self.selected_type == 'Random' else self.selected_type.lower()
+                quality = None if self.selected_quality == 'Random' else self.selected_quality
                 
                 # Generate the item
-                self.preview_item = self.item_generator.generate_item(item_type.lower(), quality)
+                self.preview_item = self.item_generator.generate_item(item_type, quality)
                 
                 # Add to player's inventory
                 if self.preview_item and player.inventory.add_item(self.preview_item):
@@ -130,13 +124,13 @@ class ItemGeneratorUI:
         pygame.draw.rect(screen, (255, 255, 255), self.rect, 2)
         
         # Draw header
-        header_text = self.font.render("Item Generator", True, (255, 255, 255))
+        header_text = render_text(self.font, "Item Generator", (255, 255, 255))
         screen.blit(header_text, (self.rect.x + 10, self.rect.y + 10))
         
         # Draw type dropdown
         pygame.draw.rect(screen, (30, 30, 30), self.type_dropdown)
         pygame.draw.rect(screen, (255, 255, 255), self.type_dropdown, 2)
-        type_text = self.font.render(f"Type: {self.selected_type}", True, (255, 255, 255))
+        type_text = render_text(self.font, f"Type: {self.selected_type}", (255, 255, 255))
         screen.blit(type_text, (self.type_dropdown.x + 10, self.type_dropdown.y + 10))
         
         # Draw expanded type options
@@ -150,13 +144,13 @@ class ItemGeneratorUI:
                 )
                 pygame.draw.rect(screen, (40, 40, 40), option_rect)
                 pygame.draw.rect(screen, (255, 255, 255), option_rect, 1)
-                option_text = self.font.render(option, True, (255, 255, 255))
+                option_text = render_text(self.font, option, (255, 255, 255))
                 screen.blit(option_text, (option_rect.x + 10, option_rect.y + 10))
         
         # Draw quality dropdown
         pygame.draw.rect(screen, (30, 30, 30), self.quality_dropdown)
         pygame.draw.rect(screen, (255, 255, 255), self.quality_dropdown, 2)
-        quality_text = self.font.render(f"Quality: {self.selected_quality}", True, (255, 255, 255))
+        quality_text = render_text(self.font, f"Quality: {self.selected_quality}", (255, 255, 255))
         screen.blit(quality_text, (self.quality_dropdown.x + 10, self.quality_dropdown.y + 10))
         
         # Draw expanded quality options
@@ -171,13 +165,13 @@ class ItemGeneratorUI:
                 pygame.draw.rect(screen, (40, 40, 40), option_rect)
                 border_color = QUALITY_COLORS.get(option, (255, 255, 255))
                 pygame.draw.rect(screen, border_color, option_rect, 2)
-                option_text = self.font.render(option, True, (255, 255, 255))
+                option_text = render_text(self.font, option, (255, 255, 255))
                 screen.blit(option_text, (option_rect.x + 10, option_rect.y + 10))
         
         # Draw generate button
         pygame.draw.rect(screen, (40, 40, 40), self.generate_button)
         pygame.draw.rect(screen, (255, 255, 255), self.generate_button, 2)
-        generate_text = self.font.render("Generate Item", True, (255, 255, 255))
+        generate_text = render_text(self.font, "Generate Item", (255, 255, 255))
         text_rect = generate_text.get_rect(center=self.generate_button.center)
         screen.blit(generate_text, text_rect)
         
@@ -192,7 +186,7 @@ class ItemGeneratorUI:
             
             # Draw item sprite
             sprite = self.preview_item.get_equipment_sprite()
-            scaled_sprite = pygame.transform.scale(sprite, (100, 100))
+            scaled_sprite = get_scaled_sprite(sprite, (100, 100))
             sprite_x = self.preview_rect.x + 10
             sprite_y = self.preview_rect.y + 10
             screen.blit(scaled_sprite, (sprite_x, sprite_y))
@@ -203,7 +197,7 @@ class ItemGeneratorUI:
             line_spacing = 25
             
             # Draw item name
-            name_text = self.font.render(self.preview_item.display_name, True, (255, 255, 255))
+            name_text = render_text(self.font, self.preview_item.display_name, (255, 255, 255))
             screen.blit(name_text, (text_x, text_y))
             
             # Draw item stats
@@ -230,5 +224,5 @@ class ItemGeneratorUI:
                 ]
             
             for i, stat in enumerate(stats):
-                stat_text = self.small_font.render(stat, True, (255, 255, 255))
+                stat_text = render_text(self.small_font, stat, (255, 255, 255))
                 screen.blit(stat_text, (text_x, text_y + (i + 1) * line_spacing)) 
\ No newline at end of file
@@ -9,6 +9,7 @@ from ..core.constants import (
     FONT_SIZES
 )
 from ..items import Item, Weapon, Armor, Hands, Consumable
+from .render_cache import get_font, get_scaled_sprite, render_text
 
 class InventoryUI:
     """A reusable inventory UI component for pygame games."""
@@ -59,8 +60,8 @@ class InventoryUI:
                 self.grid_cells.append(pygame.Rect(cell_x, cell_y, self.cell_size, self.cell_size))
         
         # Initialize fonts
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 18)
+        self.font = get_font(24)
+        self.small_font = get_font(18)
         
         # Initialize tooltip
         self.hovered_item = None
@@ -92,7 +93,7 @@ class InventoryUI:
                     if item:
                         # Try to equip the item
                         if player.equip_item(item):
-                            player.inventory.items[cell_index] = None
+                            player.inventory.remove_item(item)
                             return True
                 return True
                 
@@ -154,11 +155,11 @@ class InventoryUI:
             
             # Draw item sprite
             sprite = self.hovered_item.get_equipment_sprite()
-            scaled_sprite = pygame.transform.scale(sprite, (128, 128))
+            scaled_sprite = get_scaled_sprite(sprite, (128, 128))
             screen.blit(scaled_sprite, (tooltip_x + 10, tooltip_y + 10))
             
             # Draw item name
-            name_text = self.font.render(self.hovered_item.display_name, True, (255, 255, 255))
+            name_text = render_text(self.font, self.hovered_item.display_name, (255, 255, 255))
             screen.blit(name_text, (tooltip_x + 10, tooltip_y + 150))
             
             # Draw item stats
@@ -198,7 +199,7 @@ class InventoryUI:
                 stats.insert(1, f"Effect: {self.hovered_item.prefix}")
                 
             for stat in stats:
-                stat_text = self.small_font.render(stat, True, (255, 255, 255))
+                stat_text = render_text(self.small_font, stat, (255, 255, 255))
                 screen.blit(stat_text, (tooltip_x + 10, tooltip_y + y_offset))
                 y_offset += 20
 
@@ -212,7 +213,7 @@ class InventoryUI:
         pygame.draw.rect(screen, (255, 255, 255), self.rect, 2)
         
         # Draw header
-        header_text = self.font.render("Inventory", True, (255, 255, 255))
+        header_text = render_text(self.font, "Inventory", (255, 255, 255))
         screen.blit(header_text, (self.rect.x + 10, self.rect.y + 10))
         
         # Draw grid cells
@@ -227,7 +228,7 @@ class InventoryUI:
                 if item:
                     # Draw item sprite
                     sprite = item.get_equipment_sprite()
-                    scaled_sprite = pygame.transform.scale(sprite, (self.cell_size - 10, self.cell_size - 10))
+                    scaled_sprite = get_scaled_sprite(sprite, (self.cell_size - 10, self.cell_size - 10))
                     screen.blit(scaled_sprite, (cell.x + 5, cell.y + 5))
                     
                     # Draw quality-colored border
@@ -236,18 +237,18 @@ class InventoryUI:
                     
                     # Draw item name
                     name = item.display_name.split()[0]  # Get first word
-                    name_text = self.small_font.render(name, True, (255, 255, 255))
+                    name_text = render_text(self.small_font, name, (255, 255, 255))
                     screen.blit(name_text, (cell.x + 5, cell.y + 5))
                     
                     # Draw item stats
                     if isinstance(item, Weapon):
-                        stat_text = self.small_font.render(f"ATK:{item.attack_power}", True, (255, 255, 255))
+                        stat_text = render_text(self.small_font, f"ATK:{item.attack_power}", (255, 255, 255))
                     elif isinstance(item, Hands):
-                        stat_text = self.small_font.render(f"DEF:{item.defense}", True, (255, 255, 255))
+                        stat_text = render_text(self.small_font, f"DEF:{item.defense}", (255, 255, 255))
                     elif isinstance(item, Consumable):
-                        stat_text = self.small_font.render(f"POT:{item.effect_value}", True, (255, 255, 255))
+                        stat_text = render_text(self.small_font, f"POT:{item.effect_value}", (255, 255, 255))
                     elif isinstance(item, Armor):
-                        stat_text = self.small_font.render(f"DEF:{item.defense}", True, (255, 255, 255))
+                        stat_text = render_text(self.small_font, f"DEF:{item.defense}", (255, 255, 255))
                     else:
                         stat_text = None
                         
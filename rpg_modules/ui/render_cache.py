@@ -0,0 +1,84 @@
+"""
+Shared render caches for UI components.
+"""
+
+import weakref
+import pygame
+from typing import Dict, Tuple
+
+# Most rendered text entries kept before the oldest are evicted
+TEXT_CACHE_SIZE = 256
+
+# Scaled copies of item sprites, keyed weakly by the source sprite so the
+# entries go away together with the items that own them.
+_scaled_sprites = weakref.WeakKeyDictionary()
+
+def get_scaled_sprite(sprite: pygame.Surface, size: Tuple[int, int]) -> pygame.Surface:
+    """
+    Get a copy of a sprite scaled to the given size.
+
+    The scaled surface is created once per (sprite, size) pair and reused
+    on later frames, so callers must treat it as read-only.
+
+    Args:
+        sprite: The source sprite
+        size: Target (width, height)
+
+    Returns:
+        The scaled sprite
+    """
+    by_size = _scaled_sprites.get(sprite)
+    if by_size is None:
+        by_size = _scaled_sprites[sprite] = {}
+    scaled = by_size.get(size)
+    if scaled is None:
+        scaled = by_size[size] = pygame.transform.scale(sprite, size)
+    return scaled
+
+# Default-typeface fonts by point size, shared by every panel
+_fonts: Dict[int, pygame.font.Font] = {}
+
+def get_font(size: int) -> pygame.font.Font:
+    """
+    Get the default font at the given size, loading it on first use.
+
+    Panels that ask for the same size share one Font object, so the
+    typeface is parsed once and their text shares render_text entries.
+
+    Args:
+        size: Font size in points
+
+    Returns:
+        The shared font
+    """
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(None, size)
+    return font
+
+# Rendered text surfaces keyed by (font, text, color), oldest first
+_text_surfaces: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    Render antialiased text, reusing the surface from an earlier call.
+
+    Labels that stay the same from frame to frame are rasterized once.
+    The cache holds at most TEXT_CACHE_SIZE entries and evicts the oldest
+    first, so changing strings cannot grow it without bound.
+
+    Args:
+        font: Font to render with
+        text: The text to render
+        color: RGB text color
+
+    Returns:
+        The rendered text surface
+    """
+    key = (font, text, color)
+    surface = _text_surfaces.get(key)
+    if surface is None:
+        if len(_text_surfaces) >= TEXT_CACHE_SIZE:
+            del _text_surfaces[next(iter(_text_surfaces))]
+        surface = _text_surfaces[key] = font.render(text, True, color)
+    return surface